@@ -18,7 +18,7 @@ import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -314,7 +314,7 @@ HLV 💚 YOU \\o/ :)
         return results
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main function to handle command line execution."""
     parser = argparse.ArgumentParser(
         description="Send bilingual quiz notification emails"
@@ -331,7 +331,7 @@ def main():
     parser.add_argument("--smtp-server", default="smtp.gmail.com", help="SMTP server")
     parser.add_argument("--smtp-port", type=int, default=587, help="SMTP port")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate input files exist
     for file_path in [args.en_urls_file, args.sr_urls_file, args.recipients_file]:
@@ -0,0 +1,15 @@
+"""
+Fast JSON parsing with an optional dependency
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+
+try:
+    import orjson
+
+    # orjson is an optional speedup; it parses UTF-8 bytes directly
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
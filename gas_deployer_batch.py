@@ -9,6 +9,7 @@ import logging
 import glob
 import sys
 from pathlib import Path
+from typing import List, Optional
 from gas_deployer import GoogleAppsScriptDeployer
 
 logging.basicConfig(
@@ -68,7 +69,7 @@ def deploy_all_quizzes(
     return deployed_quizzes
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Deploy all generated quizes")
 
@@ -96,7 +97,7 @@ def main():
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -22,14 +22,22 @@ Usage Examples:
 
     # Send emails with test URLs
     python main.py email en_urls.txt sr_urls.txt recipients.txt
+
+    # Run several scripts concurrently from a batch file
+    python main.py batch batch.json
 """
 
 import argparse
+import asyncio
+import importlib
+import json
 import logging
+import os
 import sys
 import subprocess
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -38,12 +46,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _get_option_value(args: List[str], *names: str) -> Optional[str]:
+    """Return the value of a command line option from an argument list"""
+    for index, arg in enumerate(args):
+        if arg in names and index + 1 < len(args):
+            return args[index + 1]
+        for name in names:
+            if name.startswith("--") and arg.startswith(name + "="):
+                return arg[len(name) + 1 :]
+    return None
+
+
 class AITestOrchestrator:
     """Main orchestrator for the AI test system"""
 
-    def __init__(self):
-        """Initialize the orchestrator"""
+    def __init__(self, isolated: bool = False):
+        """
+        Initialize the orchestrator
+
+        Args:
+            isolated: Run each script in a separate Python process instead of
+                      calling its main() in-process
+        """
         self.base_dir = Path(__file__).parent
+        self.isolated = isolated
         self.venv_python = self.base_dir / "venv" / "bin" / "python"
 
         # Check if virtual environment exists
@@ -60,6 +86,10 @@ class AITestOrchestrator:
         """
         Run a script with the given arguments
 
+        By default the script module is imported and its main() is called
+        in-process, avoiding interpreter startup. In isolated mode the script
+        is run in a separate Python process instead.
+
         Args:
             script_name: Name of the script to run
             args: List of command line arguments
@@ -72,6 +102,33 @@ class AITestOrchestrator:
             logger.error("Script not found: %s", script_path)
             return False
 
+        if self.isolated:
+            return self._run_subprocess(script_path, args)
+
+        logger.info("Running: %s %s", script_name, " ".join(args))
+
+        # Scripts resolve paths such as QAPool/ relative to the working
+        # directory, so run them from base_dir like the subprocess path does
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(self.base_dir)
+            module = importlib.import_module(script_path.stem)
+            exit_code = module.main(args)
+        except SystemExit as e:
+            exit_code = e.code
+        except Exception as e:
+            logger.error("Error running %s: %s", script_name, e)
+            return False
+        finally:
+            os.chdir(previous_cwd)
+
+        if exit_code not in (None, 0):
+            logger.error("Script failed with exit code %s", exit_code)
+            return False
+        return True
+
+    def _run_subprocess(self, script_path: Path, args: List[str]) -> bool:
+        """Run a script in a separate Python process"""
         cmd = [self.python_cmd, str(script_path)] + args
         logger.info("Running: %s", " ".join(cmd))
 
@@ -85,6 +142,190 @@ class AITestOrchestrator:
             logger.error("RuntimeError running script: %s", e)
             return False
 
+    async def _run_script_async(
+        self,
+        script_name: str,
+        args: List[str],
+        env: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """
+        Run a script in a separate Python process without blocking the event loop
+
+        Output is captured and printed once the script finishes, so output of
+        concurrently running scripts does not interleave.
+
+        Args:
+            script_name: Name of the script to run
+            args: List of command line arguments
+            env: Environment for the process (defaults to the current one)
+
+        Returns:
+            True if script ran successfully, False otherwise
+        """
+        script_path = self.base_dir / script_name
+        if not script_path.exists():
+            logger.error("Script not found: %s", script_path)
+            return False
+
+        cmd = [self.python_cmd, str(script_path)] + args
+        logger.info("Starting: %s", " ".join(cmd))
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=self.base_dir,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        output, _ = await process.communicate()
+
+        if output:
+            sys.stdout.write(output.decode("utf-8", errors="replace"))
+
+        if process.returncode != 0:
+            logger.error("%s failed with exit code %d", script_name, process.returncode)
+            return False
+        return True
+
+    async def run_many(
+        self,
+        specs: List[Tuple[str, List[str]]],
+        envs: Optional[List[Optional[Dict[str, str]]]] = None,
+    ) -> List[bool]:
+        """
+        Run multiple scripts concurrently
+
+        Args:
+            specs: List of (script_name, args) tuples
+            envs: Optional per-spec process environments
+
+        Returns:
+            Success flag for each spec, in input order
+        """
+        envs = envs or [None] * len(specs)
+        return list(
+            await asyncio.gather(
+                *(
+                    self._run_script_async(script, args, env)
+                    for (script, args), env in zip(specs, envs)
+                )
+            )
+        )
+
+    def _share_course_materials(
+        self, specs: List[Tuple[str, List[str]]]
+    ) -> Tuple[List[shared_memory.SharedMemory], List[Optional[Dict[str, str]]]]:
+        """
+        Load course materials once for analyzer runs sharing a materials path
+
+        The materials are placed in shared memory and its name is passed to
+        the analyzer processes through their environment, so each materials
+        directory is read once instead of once per analyzer run. Runs that
+        will use a cached analysis never read the materials and are left out.
+
+        Args:
+            specs: List of (script_name, args) tuples
+
+        Returns:
+            Created shared memory blocks (to be released by the caller) and
+            the process environment for each spec
+        """
+        envs: List[Optional[Dict[str, str]]] = [None] * len(specs)
+        runs_by_path: Dict[str, List[int]] = {}
+        for index, (script, args) in enumerate(specs):
+            if Path(script).name != "test_analyzer.py":
+                continue
+            materials_path = _get_option_value(args, "--materials-path", "-m")
+            if materials_path:
+                runs_by_path.setdefault(materials_path, []).append(index)
+
+        if not any(len(indices) > 1 for indices in runs_by_path.values()):
+            return [], envs
+
+        # Imported lazily as it pulls in the OpenAI client
+        import test_analyzer
+
+        # Runs forcing a reload get a separately (re)loaded copy
+        runs_by_key: Dict[Tuple[str, bool], List[int]] = {}
+        for materials_path, indices in runs_by_path.items():
+            if len(indices) < 2:
+                continue
+            for index in indices:
+                args = specs[index][1]
+                if test_analyzer.needs_course_materials(args, self.base_dir):
+                    key = (materials_path, "--force-reload" in args)
+                    runs_by_key.setdefault(key, []).append(index)
+
+        blocks = []
+        for (materials_path, force_reload), indices in runs_by_key.items():
+            if len(indices) < 2:
+                continue
+
+            materials = test_analyzer.load_course_materials(
+                str(self.base_dir / materials_path), force_reload=force_reload
+            )
+            data = materials.encode("utf-8")
+            if not data:
+                continue
+
+            shm = shared_memory.SharedMemory(create=True, size=len(data))
+            blocks.append(shm)
+            shm.buf[: len(data)] = data
+
+            env = dict(os.environ)
+            env[test_analyzer.SHARED_MATERIALS_ENV] = (
+                f"{shm.name}:{len(data)}:{int(force_reload)}"
+            )
+            for index in indices:
+                envs[index] = env
+
+            logger.info(
+                "📚 Sharing course materials from %s with %d analyzer runs",
+                materials_path,
+                len(indices),
+            )
+
+        return blocks, envs
+
+    def run_batch(self, batch_file: str) -> bool:
+        """
+        Run all scripts listed in a batch file concurrently
+
+        The batch file is a JSON list of objects with a "script" name and an
+        optional "args" list, e.g.:
+        [{"script": "test_generator_batch.py", "args": ["QATests/l0-ai-citizen.json"]}]
+
+        Args:
+            batch_file: Path to JSON batch file
+
+        Returns:
+            True if all scripts ran successfully, False otherwise
+        """
+        try:
+            with open(batch_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            specs = [(entry["script"], entry.get("args", [])) for entry in entries]
+        except FileNotFoundError:
+            logger.error("Batch file not found: %s", batch_file)
+            return False
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.error("Invalid batch file %s: %s", batch_file, e)
+            return False
+
+        logger.info("📦 Running %d scripts concurrently", len(specs))
+        shared_blocks, envs = self._share_course_materials(specs)
+        try:
+            results = asyncio.run(self.run_many(specs, envs))
+        finally:
+            for shm in shared_blocks:
+                shm.close()
+                shm.unlink()
+
+        logger.info(
+            "📦 Batch complete: %d/%d scripts succeeded", sum(results), len(results)
+        )
+        return all(results)
+
     def generate_tests(
         self,
         config_file: str,
@@ -203,10 +444,24 @@ def main():
         "recipients_file", help="File containing recipient email addresses"
     )
 
+    # Batch command
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run multiple scripts concurrently from a batch file"
+    )
+    batch_parser.add_argument(
+        "batch_file",
+        help='JSON list of {"script": ..., "args": [...]} entries to run',
+    )
+
     # Global options
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each command in a separate Python process",
+    )
 
     args = parser.parse_args()
 
@@ -220,7 +475,7 @@ def main():
         return 1
 
     # Initialize orchestrator
-    orchestrator = AITestOrchestrator()
+    orchestrator = AITestOrchestrator(isolated=args.isolated)
 
     try:
         # Execute the requested command
@@ -244,6 +499,9 @@ def main():
                 recipients_file=args.recipients_file,
             )
 
+        elif args.command == "batch":
+            success = orchestrator.run_batch(batch_file=args.batch_file)
+
         else:
             logger.error("Unknown command: %s", args.command)
             return 1
@@ -12,13 +12,24 @@ Usage:
 """
 
 import argparse
+import hashlib
+import io
 import json
 import logging
+import math
+import mmap
 import os
 import re
+import string
 import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import resource_tracker, shared_memory
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
 
 from openai import OpenAI
 
@@ -31,11 +42,67 @@ logger = logging.getLogger(__name__)
 # Default prompt file path
 PROMPT_FILE = "prompts/test_analyzer_prompt.md"
 
+# Marker preceding the questions array in generated .gs files
+QUESTIONS_POOL_MARKER = b"const questionsPool"
+
+# Tokens relevant for bracket matching: double-quoted strings (skipped as a
+# whole, so brackets inside question text are ignored) and square brackets
+_JS_ARRAY_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]]', re.DOTALL)
+
+# Unquoted object keys emitted by the generator, quoted to obtain valid JSON
+_JS_KEY_RE = re.compile(r"(\s)(question|choices|correct):")
+
+# "Don't know" options appended by the generator, excluded from analysis
+_SKIP_CHOICES = frozenset(("I don't know", "Ne znam"))
+
+# Separator placed between files in the concatenated course materials
+MATERIALS_SEPARATOR = "\n\n---\n\n"
+
+# Default prompt budget for course materials, and the rough characters per
+# token ratio used to estimate it without a tokenizer
+DEFAULT_MATERIALS_TOKEN_BUDGET = 60000
+CHARS_PER_TOKEN = 4
+
+_WORD_RE = re.compile(r"\w+")
+
+# Boundary between files in the concatenated course materials. The header
+# lookahead keeps "---" rules inside a file from splitting it.
+_MATERIALS_FILE_SPLIT_RE = re.compile(
+    re.escape(MATERIALS_SEPARATOR) + r"(?=## [^\n]*\.md\n\n)"
+)
+
+# Indented "A. ", "B. ", ... prefixes for answers in the analysis listing
+_ANSWER_PREFIXES = tuple(f"  {letter}. " for letter in string.ascii_uppercase)
+
+# Environment variable through which a parent process (main.py batch) shares
+# already loaded course materials, as "<shared memory name>:<byte length>:<0|1>";
+# the last field tells whether the parent force-reloaded them
+SHARED_MATERIALS_ENV = "AI_TEST_SHARED_MATERIALS"
+
+# Process-wide OpenAI client, see get_client()
+_client: Optional[OpenAI] = None
+
+# On-disk cache for expensive, reproducible intermediate results
+CACHE_DIR = Path.home() / ".cache" / "ai-test-platform"
+
+# How long cached GPT analyses are reused (seconds)
+RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+@lru_cache(maxsize=64)
+def _load_prompt_cached(prompt_path: str, mtime_ns: int) -> str:
+    """Read a prompt file; mtime_ns is part of the cache key only"""
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        return f.read()
+
 
 def load_prompt(prompt_path: str = PROMPT_FILE) -> str:
     """
     Load the LLM prompt from file
 
+    The file is parsed once per process and re-read only when its
+    modification time changes.
+
     Args:
         prompt_path: Path to the prompt file
 
@@ -43,13 +110,44 @@ def load_prompt(prompt_path: str = PROMPT_FILE) -> str:
         Prompt content as string
     """
     try:
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read()
+        mtime_ns = os.stat(prompt_path).st_mtime_ns
+        return _load_prompt_cached(prompt_path, mtime_ns)
     except FileNotFoundError:
         logger.error("Prompt file not found: %s", prompt_path)
         raise
 
 
+def _extract_js_array(content: bytes) -> Optional[bytes]:
+    """
+    Extract the questionsPool array literal from generated script source
+
+    Args:
+        content: Raw (UTF-8 encoded) source of the generated .gs file; any
+                 bytes-like object, including an mmap, is accepted
+
+    Returns:
+        The array literal including its brackets, or None if not found
+    """
+    marker = content.find(QUESTIONS_POOL_MARKER)
+    if marker == -1:
+        return None
+
+    start = content.find(b"[", marker)
+    if start == -1:
+        return None
+
+    depth = 0
+    for token in _JS_ARRAY_TOKEN_RE.finditer(content, start):
+        if token.group() == b"[":
+            depth += 1
+        elif token.group() == b"]":
+            depth -= 1
+            if depth == 0:
+                return content[start : token.end()]
+
+    return None
+
+
 def parse_questions_from_gs_file(gs_file_path: str) -> List[Dict[str, Any]]:
     """
     Parse questions from a generated Google Apps Script (.gs) file
@@ -64,29 +162,34 @@ def parse_questions_from_gs_file(gs_file_path: str) -> List[Dict[str, Any]]:
         gs_file_path: Path to the generated .gs file
 
     Returns:
-        List of question dictionaries with 'question', 'answers', and 'correct' keys
+        List of question dictionaries with 'question', 'answers', 'correct' and
+        'correct_idx' (index of the correct answer in 'answers') keys
     """
+    # Memory-map the file and extract the questionsPool array from the
+    # JavaScript, so only the array itself is copied and decoded
     try:
-        with open(gs_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        with open(gs_file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                js_bytes = None
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    js_bytes = _extract_js_array(mm)
     except FileNotFoundError:
         logger.error("Test file not found: %s", gs_file_path)
         raise
 
-    # Extract the questionsPool array from the JavaScript
-    # Pattern matches: const questionsPool = [...]
-    pattern = r"const questionsPool = (\[.*?\]);"
-    match = re.search(pattern, content, re.DOTALL)
-
-    if not match:
+    if js_bytes is None:
         logger.error("Could not find questionsPool in %s", gs_file_path)
         raise ValueError(f"Could not parse questions from {gs_file_path}")
 
-    js_array = match.group(1)
+    try:
+        js_array = js_bytes.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Could not parse questions from {gs_file_path}: {e}")
 
     # Convert JavaScript object notation to valid JSON
     # Replace unquoted keys with quoted keys
-    json_str = re.sub(r"(\s)(question|choices|correct):", r'\1"\2":', js_array)
+    json_str = _JS_KEY_RE.sub(r'\1"\2":', js_array)
 
     try:
         questions_raw = json.loads(json_str)
@@ -100,16 +203,23 @@ def parse_questions_from_gs_file(gs_file_path: str) -> List[Dict[str, Any]]:
         correct_idx = q["correct"]
         choices = q["choices"]
         # Filter out "I don't know" / "Ne znam" from answers for analysis
-        real_choices = [c for c in choices if c not in ("I don't know", "Ne znam")]
+        real_choices = [c for c in choices if c not in _SKIP_CHOICES]
         correct_answer = (
             choices[correct_idx] if correct_idx < len(choices) else real_choices[0]
         )
+        # Position of the correct answer among real choices (None if absent)
+        correct_idx_in_real = (
+            real_choices.index(correct_answer)
+            if correct_answer in real_choices
+            else None
+        )
 
         questions.append(
             {
                 "question": q["question"],
                 "answers": real_choices,
                 "correct": correct_answer,
+                "correct_idx": correct_idx_in_real,
             }
         )
 
@@ -117,12 +227,189 @@ def parse_questions_from_gs_file(gs_file_path: str) -> List[Dict[str, Any]]:
     return questions
 
 
-def load_course_materials(materials_path: str) -> str:
+def _find_markdown_files(materials_path: str) -> List[os.DirEntry]:
+    """
+    Recursively collect markdown files below a directory
+
+    Uses os.scandir, so file type information comes from the directory
+    listing and stat results are cached on the returned entries.
+
+    Args:
+        materials_path: Path to directory containing markdown files
+
+    Returns:
+        Markdown file entries sorted by path
+    """
+    md_files = []
+    pending_dirs = [materials_path]
+
+    while pending_dirs:
+        directory = pending_dirs.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        md_files.append(entry)
+        except OSError as e:
+            logger.warning("Could not scan %s: %s", directory, e)
+
+    md_files.sort(key=lambda entry: entry.path.split(os.sep))
+    return md_files
+
+
+def _fingerprint_markdown_files(
+    materials_path: str, md_files: List[os.DirEntry]
+) -> str:
+    """
+    Fingerprint markdown files by metadata (relative path, mtime and size)
+
+    Args:
+        materials_path: Path to directory containing markdown files
+        md_files: Markdown file entries as returned by _find_markdown_files
+
+    Returns:
+        Hex digest identifying the current state of the files
+    """
+    fingerprint = hashlib.blake2b(digest_size=16)
+    fingerprint.update(str(Path(materials_path).resolve()).encode("utf-8"))
+
+    for md_file in md_files:
+        st = md_file.stat()
+        relative_path = os.path.relpath(md_file.path, materials_path)
+        entry = f"{relative_path}\0{st.st_mtime_ns}\0{st.st_size}\n"
+        fingerprint.update(entry.encode("utf-8"))
+
+    return fingerprint.hexdigest()
+
+
+def materials_fingerprint(materials_path: str) -> str:
+    """
+    Fingerprint course materials without reading any file contents
+
+    Any edit to a markdown file changes its mtime, so the fingerprint changes
+    whenever the concatenated materials would.
+
+    Args:
+        materials_path: Path to directory containing markdown files
+
+    Returns:
+        Hex digest identifying the current state of the materials
+    """
+    return _fingerprint_markdown_files(
+        materials_path, _find_markdown_files(materials_path)
+    )
+
+
+def _materials_cache_path(materials_path: str) -> Path:
+    """
+    Compute the cache file location for a materials directory
+
+    There is one cache file per directory, so edits to the materials replace
+    it instead of leaving stale copies behind. The file starts with the
+    fingerprint of the materials it holds.
+
+    Args:
+        materials_path: Path to directory containing markdown files
+
+    Returns:
+        Path of the cache file holding the concatenated materials
+    """
+    key = hashlib.blake2b(
+        str(Path(materials_path).resolve()).encode("utf-8"), digest_size=16
+    )
+    return CACHE_DIR / f"materials-{key.hexdigest()}.txt"
+
+
+def _write_cache_file(cache_file: Path, content: str) -> None:
+    """Atomically write content to a cache file, ignoring I/O failures"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Could not write cache file %s: %s", cache_file, e)
+
+
+def _response_cache_path(model: str, *inputs: str) -> Path:
+    """
+    Compute the cache file location for a GPT response
+
+    Args:
+        model: Model used for the analysis
+        *inputs: All remaining inputs that determine the response
+
+    Returns:
+        Path of the cache file for this combination of inputs
+    """
+    key = hashlib.blake2b(digest_size=16)
+    for part in (model, *inputs):
+        key.update(part.encode("utf-8"))
+        key.update(b"\0")
+    return CACHE_DIR / "gpt" / f"{key.hexdigest()}.txt"
+
+
+def _read_cached_response(cache_file: Path) -> Optional[str]:
+    """Return a cached GPT response, or None if missing or expired"""
+    try:
+        if time.time() - cache_file.stat().st_mtime > RESPONSE_CACHE_TTL:
+            return None
+        return cache_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("Could not read cache file %s: %s", cache_file, e)
+        return None
+
+
+def _prune_expired_responses(cache_dir: Path) -> None:
+    """Delete cached GPT responses older than RESPONSE_CACHE_TTL"""
+    cutoff = time.time() - RESPONSE_CACHE_TTL
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.name.endswith(".txt") and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass  # Removed concurrently by another run
+    except OSError as e:
+        logger.warning("Could not prune cache directory %s: %s", cache_dir, e)
+
+
+def _read_markdown_file(md_file: os.DirEntry) -> Optional[str]:
+    """Read a single markdown file, returning None if it cannot be read"""
+    try:
+        with open(md_file.path, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception as e:
+        logger.warning("Could not read %s: %s", md_file.path, e)
+        return None
+
+
+def load_course_materials(
+    materials_path: str,
+    force_reload: bool = False,
+    fingerprint: Optional[str] = None,
+) -> str:
     """
     Load and concatenate all markdown files from the materials directory
 
+    The concatenated result is cached on disk and reused as long as no
+    markdown file was added, removed or modified.
+
     Args:
         materials_path: Path to directory containing markdown files
+        force_reload: Re-read all files even if a cached copy exists
+        fingerprint: materials_fingerprint() of the directory, if the caller
+                     already computed it (optional)
 
     Returns:
         Concatenated content of all markdown files
@@ -132,19 +419,217 @@ def load_course_materials(materials_path: str) -> str:
         logger.error("Materials directory not found: %s", materials_path)
         return ""
 
-    content_parts = []
-    md_files = sorted(materials_dir.glob("**/*.md"))
-
-    for md_file in md_files:
+    md_files = None
+    if fingerprint is None:
+        md_files = _find_markdown_files(materials_path)
+        fingerprint = _fingerprint_markdown_files(materials_path, md_files)
+    cache_file = _materials_cache_path(materials_path)
+    if not force_reload:
         try:
-            with open(md_file, "r", encoding="utf-8") as f:
-                file_content = f.read()
-                content_parts.append(f"## {md_file.name}\n\n{file_content}")
-        except Exception as e:
-            logger.warning("Could not read %s: %s", md_file, e)
+            cached_fingerprint, _, materials = cache_file.read_text(
+                encoding="utf-8"
+            ).partition("\n")
+            if cached_fingerprint == fingerprint:
+                logger.info("Loaded course materials from cache %s", cache_file)
+                return materials
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not read cache file %s: %s", cache_file, e)
+
+    if md_files is None:
+        md_files = _find_markdown_files(materials_path)
+
+    buffer = io.StringIO()
+    loaded_count = 0
+    complete = True
+
+    # Reads are I/O-bound, so overlap them; map() yields in sorted order and
+    # each file is streamed into the buffer as soon as it is available
+    with ThreadPoolExecutor(max_workers=min(32, len(md_files) or 1)) as executor:
+        for md_file, file_content in zip(
+            md_files, executor.map(_read_markdown_file, md_files)
+        ):
+            if file_content is None:
+                complete = False
+                continue
+            if loaded_count:
+                buffer.write(MATERIALS_SEPARATOR)
+            buffer.write(f"## {md_file.name}\n\n")
+            buffer.write(file_content)
+            loaded_count += 1
+
+    logger.info("Loaded %d markdown files from %s", loaded_count, materials_path)
+    materials = buffer.getvalue()
+    # A failed read leaves the fingerprint unchanged (e.g. a later chmod), so
+    # caching partial materials would keep serving them until a file is edited
+    if complete:
+        _write_cache_file(cache_file, f"{fingerprint}\n{materials}")
+    else:
+        logger.warning("Not caching course materials: some files could not be read")
+    return materials
+
+
+def _attach_shared_materials(force_reload: bool = False) -> Optional[str]:
+    """
+    Read course materials shared by the parent process, if any
+
+    Args:
+        force_reload: Only accept materials the parent force-reloaded
+
+    Returns:
+        Course materials from shared memory, or None if none were shared
+    """
+    shared_spec = os.environ.get(SHARED_MATERIALS_ENV)
+    if not shared_spec:
+        return None
+
+    name, size, reloaded = shared_spec.rsplit(":", 2)
+    if force_reload and reloaded != "1":
+        return None
+
+    try:
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # Attaching registers the block with this process's resource
+            # tracker, which would unlink it on exit; the parent owns it.
+            # The tracker knows POSIX blocks by their slash-prefixed name.
+            if os.name == "posix":
+                resource_tracker.unregister(f"/{shm.name}", "shared_memory")
+    except (OSError, ValueError) as e:
+        logger.warning("Could not attach shared course materials %s: %s", name, e)
+        return None
+
+    try:
+        return bytes(shm.buf[: int(size)]).decode("utf-8")
+    finally:
+        shm.close()
+
+
+def _load_course_materials_shared(
+    materials_path: str, force_reload: bool = False, fingerprint: Optional[str] = None
+) -> str:
+    """Load course materials, preferring a copy shared by the parent process"""
+    materials = _attach_shared_materials(force_reload)
+    if materials is not None:
+        logger.info("Using course materials shared by parent process")
+        return materials
+    return load_course_materials(materials_path, force_reload, fingerprint)
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _bm25_scores(
+    documents: List[List[str]], query: List[str], k1: float = 1.5, b: float = 0.75
+) -> List[float]:
+    """
+    Score tokenized documents against a tokenized query using Okapi BM25
+
+    Args:
+        documents: List of documents, each a list of terms
+        query: Query terms
+        k1: Term frequency saturation parameter
+        b: Document length normalization parameter
+
+    Returns:
+        BM25 score for each document, in input order
+    """
+    doc_count = len(documents)
+    avg_length = sum(len(doc) for doc in documents) / doc_count or 1
+    doc_freq = Counter()
+    for doc in documents:
+        doc_freq.update(set(doc))
+
+    query_terms = set(query)
+    idf = {
+        term: math.log((doc_count - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5) + 1)
+        for term in query_terms
+    }
+
+    scores = []
+    for doc in documents:
+        term_freq = Counter(doc)
+        length_norm = k1 * (1 - b + b * len(doc) / avg_length)
+        score = 0.0
+        for term in query_terms:
+            freq = term_freq.get(term)
+            if freq:
+                score += idf[term] * freq * (k1 + 1) / (freq + length_norm)
+        scores.append(score)
+
+    return scores
+
+
+def select_relevant_materials(
+    course_materials: str, questions_text: str, token_budget: int
+) -> str:
+    """
+    Trim course materials to a token budget, keeping the most relevant files
+
+    Materials that fit the budget are returned unchanged. Otherwise the
+    per-file sections are ranked by BM25 relevance to the questions and the
+    best ones are kept, in their original order, until the budget is used.
+    The best-ranked section that does not fit is truncated to the remaining
+    budget rather than dropped.
+
+    Args:
+        course_materials: Concatenated course materials
+        questions_text: Formatted test questions used as the relevance query
+        token_budget: Maximum estimated tokens of materials to keep
+
+    Returns:
+        Course materials that fit within the token budget
+    """
+    if _estimate_tokens(course_materials) <= token_budget:
+        return course_materials
+
+    sections = _MATERIALS_FILE_SPLIT_RE.split(course_materials)
+    scores = _bm25_scores(
+        [_WORD_RE.findall(section.lower()) for section in sections],
+        _WORD_RE.findall(questions_text.lower()),
+    )
+
+    selected = {}
+    used_tokens = 0
+    for index in sorted(range(len(sections)), key=scores.__getitem__, reverse=True):
+        section = sections[index]
+        section_tokens = _estimate_tokens(section)
+        if used_tokens + section_tokens <= token_budget:
+            selected[index] = section
+            used_tokens += section_tokens
+            continue
+
+        # Fill the rest of the budget with the start of this section, so
+        # one oversized relevant file is never silently left out
+        remaining_chars = (token_budget - used_tokens - 1) * CHARS_PER_TOKEN
+        if remaining_chars > 0:
+            selected[index] = section[:remaining_chars]
+            used_tokens += _estimate_tokens(selected[index])
+        break
+
+    logger.info(
+        "Trimmed course materials to %d/%d sections (~%d tokens)",
+        len(selected),
+        len(sections),
+        used_tokens,
+    )
+    return MATERIALS_SEPARATOR.join(selected[index] for index in sorted(selected))
 
-    logger.info("Loaded %d markdown files from %s", len(content_parts), materials_path)
-    return "\n\n---\n\n".join(content_parts)
+
+def _iter_analysis_lines(questions: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the lines of the analysis representation of questions"""
+    for i, q in enumerate(questions, 1):
+        yield f"Q{i}: {q['question']}"
+        correct_idx = q["correct_idx"]
+        for j, answer in enumerate(q["answers"]):
+            marker = "✓" if j == correct_idx else " "
+            yield f"{_ANSWER_PREFIXES[j]}[{marker}] {answer}"
+        yield ""
 
 
 def format_questions_for_analysis(questions: List[Dict[str, Any]]) -> str:
@@ -152,20 +637,95 @@ def format_questions_for_analysis(questions: List[Dict[str, Any]]) -> str:
     Format questions for LLM analysis
 
     Args:
-        questions: List of question dictionaries
+        questions: List of question dictionaries as returned by
+                   parse_questions_from_gs_file
 
     Returns:
         Formatted string representation of questions
     """
-    formatted = []
-    for i, q in enumerate(questions, 1):
-        formatted.append(f"Q{i}: {q['question']}")
-        for j, answer in enumerate(q["answers"]):
-            marker = "✓" if answer == q["correct"] else " "
-            formatted.append(f"  {chr(65 + j)}. [{marker}] {answer}")
-        formatted.append("")
+    return "\n".join(_iter_analysis_lines(questions))
 
-    return "\n".join(formatted)
+
+def analysis_cache_path(
+    model: str,
+    system_prompt: str,
+    questions: List[Dict[str, Any]],
+    materials_key: str,
+    materials_token_budget: int = DEFAULT_MATERIALS_TOKEN_BUDGET,
+    formatted_questions: Optional[str] = None,
+) -> Path:
+    """
+    Compute the cache file location for a GPT analysis
+
+    Args:
+        model: Model used for the analysis
+        system_prompt: System prompt for the LLM
+        questions: List of test questions
+        materials_key: Identifies the course materials, either their content
+                       or a materials_fingerprint() of their directory
+        materials_token_budget: Token budget applied to the course materials
+        formatted_questions: format_questions_for_analysis() of the questions,
+                             if the caller already has it (optional)
+
+    Returns:
+        Path of the cache file for this analysis
+    """
+    if formatted_questions is None:
+        formatted_questions = format_questions_for_analysis(questions)
+    return _response_cache_path(
+        model,
+        system_prompt,
+        formatted_questions,
+        materials_key,
+        str(materials_token_budget),
+    )
+
+
+def get_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    Return the process-wide OpenAI client, creating it on first use
+
+    Reusing one client keeps its HTTP connection pool, and with it the
+    established TLS connections, alive across analyses.
+
+    Args:
+        api_key: OpenAI API key (defaults to the OPENAI_API_KEY variable)
+
+    Returns:
+        Shared OpenAI client
+    """
+    global _client
+    if _client is None:
+        _client = OpenAI(api_key=api_key or os.environ["OPENAI_API_KEY"])
+    return _client
+
+
+def _print_streamed_response(stream) -> str:
+    """
+    Print streamed completion deltas as they arrive
+
+    Args:
+        stream: Streaming chat completion response
+
+    Returns:
+        Full response text
+    """
+    parts = []
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                print(delta, end="", flush=True)
+                parts.append(delta)
+    except KeyboardInterrupt:
+        stream.close()
+        print()
+        raise
+
+    print()
+    return "".join(parts)
 
 
 def analyze_test_with_gpt(
@@ -174,21 +734,61 @@ def analyze_test_with_gpt(
     course_materials: str,
     system_prompt: str,
     model: str = "gpt-4.1",
+    materials_token_budget: int = DEFAULT_MATERIALS_TOKEN_BUDGET,
+    stream: bool = False,
+    cache_file: Optional[Path] = None,
+    refresh_cache: bool = False,
+    formatted_questions: Optional[str] = None,
 ) -> str:
     """
     Analyze test questions for redundancy and suggest replacements using GPT
 
+    Responses are cached on disk, so repeated runs with identical inputs do
+    not call the API again.
+
     Args:
         client: OpenAI client
         questions: List of test questions
         course_materials: Course materials content
         system_prompt: System prompt for the LLM
         model: Model to use for analysis
+        materials_token_budget: Maximum estimated tokens of course materials
+                                to include; the most relevant sections are kept
+        stream: Print the response to stdout while it is being received
+        cache_file: Cache file for the response (see analysis_cache_path);
+                    derived from the course materials content when omitted
+        refresh_cache: Ignore a cached response and store a fresh one
+        formatted_questions: format_questions_for_analysis() of the questions,
+                             if the caller already has it (optional)
 
     Returns:
         Analysis result from GPT
     """
-    formatted_questions = format_questions_for_analysis(questions)
+    if cache_file is None:
+        if formatted_questions is None:
+            formatted_questions = format_questions_for_analysis(questions)
+        cache_file = analysis_cache_path(
+            model,
+            system_prompt,
+            questions,
+            course_materials,
+            materials_token_budget,
+            formatted_questions,
+        )
+
+    if not refresh_cache:
+        cached_analysis = _read_cached_response(cache_file)
+        if cached_analysis is not None:
+            logger.info("Using cached analysis from %s", cache_file)
+            if stream:
+                print(cached_analysis)
+            return cached_analysis
+
+    if formatted_questions is None:
+        formatted_questions = format_questions_for_analysis(questions)
+    course_materials = select_relevant_materials(
+        course_materials, formatted_questions, materials_token_budget
+    )
 
     user_message = f"""## Course Materials
 
@@ -220,17 +820,27 @@ def analyze_test_with_gpt(
             ],
             temperature=0.3,
             max_tokens=4000,
+            stream=stream,
         )
 
-        return response.choices[0].message.content
+        if stream:
+            analysis = _print_streamed_response(response)
+        else:
+            analysis = response.choices[0].message.content
 
     except Exception as e:
         logger.error("Error calling OpenAI API: %s", e)
         raise
 
+    if analysis:
+        _write_cache_file(cache_file, analysis)
+        # Every distinct input adds an entry, so drop the expired ones
+        _prune_expired_responses(cache_file.parent)
+    return analysis
 
-def main():
-    """Main entry point"""
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(
         description="Analyze generated test files for topic redundancy using GPT-4.1"
     )
@@ -253,6 +863,14 @@ def main():
         "--model", default="gpt-4.1", help="OpenAI model to use (default: gpt-4.1)"
     )
 
+    parser.add_argument(
+        "--max-material-tokens",
+        type=int,
+        default=DEFAULT_MATERIALS_TOKEN_BUDGET,
+        help="Approximate token budget for course materials sent to the model "
+        f"(default: {DEFAULT_MATERIALS_TOKEN_BUDGET})",
+    )
+
     parser.add_argument(
         "--prompt-file",
         "-p",
@@ -260,11 +878,61 @@ def main():
         help=f"Path to prompt file (default: {PROMPT_FILE})",
     )
 
+    parser.add_argument(
+        "--force-reload",
+        action="store_true",
+        help="Ignore cached course materials and analyses and rebuild them",
+    )
+
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def needs_course_materials(argv: List[str], base_dir: Path = Path(".")) -> bool:
+    """
+    Tell whether an analyzer run would have to load its course materials
+
+    A run that finds a cached analysis never reads them, so a parent process
+    only needs to load materials on behalf of runs that miss the cache.
+
+    Args:
+        argv: Command line arguments of the analyzer run
+        base_dir: Directory relative paths in argv are resolved against
+
+    Returns:
+        True if the run would load course materials
+    """
+    try:
+        args = _build_arg_parser().parse_args(argv)
+    except SystemExit:
+        return False  # The run fails on its arguments before loading anything
+    if args.force_reload:
+        return True
+
+    try:
+        system_prompt = load_prompt(str(base_dir / args.prompt_file))
+        questions = parse_questions_from_gs_file(str(base_dir / args.test_file))
+    except (OSError, ValueError):
+        return False  # The run fails before loading materials
+    if not questions:
+        return False
+
+    cache_file = analysis_cache_path(
+        args.model,
+        system_prompt,
+        questions,
+        materials_fingerprint(str(base_dir / args.materials_path)),
+        args.max_material_tokens,
+    )
+    return _read_cached_response(cache_file) is None
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point"""
+    args = _build_arg_parser().parse_args(argv)
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -291,37 +959,72 @@ def main():
 
         logger.info("Parsed %d questions for analysis", len(questions))
 
-        # Load course materials
-        logger.info("Loading course materials from %s", args.materials_path)
-        course_materials = load_course_materials(args.materials_path)
+        # Decide on a cached analysis from file metadata alone, so the course
+        # materials are not read at all when the analysis is already cached
+        formatted_questions = format_questions_for_analysis(questions)
+        fingerprint = materials_fingerprint(args.materials_path)
+        cache_file = analysis_cache_path(
+            args.model,
+            system_prompt,
+            questions,
+            fingerprint,
+            args.max_material_tokens,
+            formatted_questions,
+        )
+        analysis = None if args.force_reload else _read_cached_response(cache_file)
 
-        if not course_materials:
-            logger.warning("No course materials loaded. Analysis may be limited.")
+        if analysis is None:
+            # Load course materials in the background while the client is set
+            # up; this only happens once prompt and questions are known to be valid
+            logger.info("Loading course materials from %s", args.materials_path)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                materials_future = executor.submit(
+                    _load_course_materials_shared,
+                    args.materials_path,
+                    args.force_reload,
+                    fingerprint,
+                )
 
-        # Initialize OpenAI client
-        client = OpenAI(api_key=api_key)
+                # Initialize OpenAI client
+                client = get_client(api_key)
 
-        # Perform analysis
-        analysis = analyze_test_with_gpt(
-            client=client,
-            questions=questions,
-            course_materials=course_materials,
-            system_prompt=system_prompt,
-            model=args.model,
-        )
+                course_materials = materials_future.result()
+
+            if not course_materials:
+                logger.warning("No course materials loaded. Analysis may be limited.")
 
-        # Output results
         print("\n" + "=" * 80)
         print("TEST ANALYSIS RESULTS")
         print("=" * 80)
         print(f"Test file: {args.test_file}")
         print(f"Questions analyzed: {len(questions)}")
         print("=" * 80 + "\n")
-        print(analysis)
+
+        if analysis is not None:
+            logger.info("Using cached analysis from %s", cache_file)
+            print(analysis)
+        else:
+            # Perform analysis, printing the results as they arrive
+            analyze_test_with_gpt(
+                client=client,
+                questions=questions,
+                course_materials=course_materials,
+                system_prompt=system_prompt,
+                model=args.model,
+                materials_token_budget=args.max_material_tokens,
+                stream=True,
+                cache_file=cache_file,
+                refresh_cache=True,
+                formatted_questions=formatted_questions,
+            )
+
         print("\n" + "=" * 80)
 
         return 0
 
+    except KeyboardInterrupt:
+        logger.info("⏹️  Analysis interrupted by user")
+        return 1
     except FileNotFoundError as e:
         logger.error("File not found: %s", e)
         return 1
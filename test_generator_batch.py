@@ -7,14 +7,20 @@ Supports both English (ENG) and Serbian (SRB) languages.
 """
 
 import argparse
-import json
+import itertools
 import logging
 import os
+import re
+import stat
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
-from test_generator import QuestionGenerator
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from fast_json import json_loads
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +28,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Batches up to this many variants are generated without worker processes
+# unless a worker count is requested, since starting them costs more than
+# it saves
+INLINE_MAX_JOBS = 64
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
@@ -34,26 +45,89 @@ def load_config(config_path: str) -> Dict[str, Any]:
         Configuration dictionary
     """
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = json_loads(Path(config_path).read_bytes())
         logger.info("Loaded configuration from %s", config_path)
         return config
     except FileNotFoundError:
         logger.error("Configuration file not found: %s", config_path)
         raise
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
         logger.error("Invalid JSON in configuration file: %s", e)
         raise
 
 
-def generate_test_variants(
+def _generate_one(
+    test_name: str,
+    lang: str,
+    results_sheet: str,
+    content_config: Dict[str, int],
+    path_prefix: str,
+    variant_num: int,
+) -> Tuple[str, int]:
+    """
+    Generate a single test variant (runs in a worker process or thread)
+
+    Args:
+        test_name: Test name used in the title and file name
+        lang: Language code ("en" or "rs")
+        results_sheet: Google Sheets document ID to store results
+        content_config: Dictionary mapping relative paths to question counts
+        path_prefix: Output path up to the variant number
+        variant_num: Variant number
+
+    Returns:
+        Tuple of (output path, script length in characters)
+    """
+    output_path = f"{path_prefix}{variant_num}.gs"
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "📝 Generating variant %d: %s",
+            variant_num,
+            os.path.basename(output_path),
+        )
+
+    # Imported here so --help and --list-files do not load the generator
+    from test_generator import QuestionGenerator
+
+    # Construction is cheap, and a generator per call is never shared
+    # between threads (generators rewrite their title while generating)
+    generator = QuestionGenerator(
+        name=test_name, language=lang, results_sheet=results_sheet
+    )
+
+    # Generate test for the specified language
+    script_content = generator.generate_test_for_language(
+        content_config=content_config,
+        language=lang,
+        output_path=output_path,
+        variant_number=variant_num,
+    )
+
+    return output_path, len(script_content)
+
+
+@dataclass(frozen=True, slots=True)
+class RunOpts:
+    """Settings for one batch generation run, after applying overrides"""
+
+    test_name: str
+    results_sheet: str
+    content_config: Dict[str, int]
+    languages: Tuple[str, ...]
+    variants: int
+    output: str
+
+
+def resolve_run_opts(
     config: Dict[str, Any],
     language: str = None,
     num_variants: int = None,
     output_dir: str = None,
-) -> list:
+) -> RunOpts:
     """
-    Generate multiple test variants based on configuration
+    Combine configuration values with command-line overrides
 
     Args:
         config: Configuration dictionary from JSON file
@@ -62,77 +136,241 @@ def generate_test_variants(
         output_dir: Override output directory from config
 
     Returns:
-        List of generated file paths
-    """
-    # Use config values or overrides
-    test_name = config["name"]
-    results_sheet = config["results_sheet"]
-    content_config = config["content"]
-    config_language = config.get("language", "both").lower()
-    variants = num_variants if num_variants is not None else config.get("variants", 10)
-    output = output_dir if output_dir is not None else config.get("output-dir", "/tmp")
+        Resolved run settings
 
+    Raises:
+        KeyError: If a required configuration field is missing
+    """
     # Determine which languages to generate
+    config_language = config.get("language", "both").lower()
     if language:
-        languages_to_generate = [language.lower()]
+        languages = (language.lower(),)
     elif config_language == "both":
-        languages_to_generate = ["en", "rs"]
+        languages = ("en", "rs")
     else:
-        languages_to_generate = [config_language.lower()]
+        languages = (config_language,)
+
+    return RunOpts(
+        test_name=config["name"],
+        results_sheet=config["results_sheet"],
+        content_config=config["content"],
+        languages=languages,
+        variants=(
+            num_variants if num_variants is not None else config.get("variants", 10)
+        ),
+        output=output_dir or config.get("output-dir", "/tmp"),
+    )
 
-    logger.info("🎯 Generating %d variants for test '%s'", variants, test_name)
 
-    # Create output directory if it doesn't exist
-    Path(output).mkdir(parents=True, exist_ok=True)
+def generate_test_variants(
+    config: Dict[str, Any],
+    language: str = None,
+    num_variants: int = None,
+    output_dir: str = None,
+    jobs: Optional[int] = None,
+    executor_type: str = "process",
+) -> list:
+    """
+    Generate multiple test variants based on configuration
 
-    # Get current date for file naming
-    current_date = datetime.now().strftime("%Y-%m-%d")
+    Args:
+        config: Configuration dictionary from JSON file
+        language: Override language from config ("en", "rs", or None for config default)
+        num_variants: Override number of variants from config
+        output_dir: Override output directory from config
+        jobs: Number of workers (optional)
+        executor_type: "process" or "thread"
 
-    generated_files = []
+    Returns:
+        List of generated file paths, in completion order
+    """
+    opts = resolve_run_opts(config, language, num_variants, output_dir)
+    return list(iter_generate_test_variants(opts, jobs, executor_type))
 
-    # Generate for each language
-    for lang in languages_to_generate:
-        logger.info("📝 Generating %d variants in %s", variants, lang)
 
-        # Initialize generator for this language
-        generator = QuestionGenerator(
-            name=test_name, language=lang, results_sheet=results_sheet
-        )
+def _run_jobs(
+    opts: RunOpts,
+    path_prefixes: Dict[str, str],
+    executor_class: Optional[type],
+    max_workers: int,
+) -> Iterator[Tuple[str, int, Optional[Tuple[str, int]]]]:
+    """
+    Generate every (language, variant) pair of a batch
 
-        for variant_num in range(1, variants + 1):
-            try:
-                filename = f"{test_name} | {current_date} | [{lang}] | Variant {variant_num}.gs"
-                output_path = os.path.join(output, filename)
+    Args:
+        opts: Resolved run settings
+        path_prefixes: Output path up to the variant number, per language
+        executor_class: Executor to run the jobs in, or None to run them in
+                        the calling thread
+        max_workers: Number of workers
+
+    Yields:
+        Tuples of (language, variant number, result), in completion order;
+        the result is None if the variant failed
+    """
+    jobs = list(itertools.product(opts.languages, range(1, opts.variants + 1)))
 
-                logger.info(
-                    "📝 Generating variant %d/%d: %s", variant_num, variants, filename
+    if executor_class is None:
+        for lang, variant_num in jobs:
+            try:
+                result = _generate_one(
+                    opts.test_name,
+                    lang,
+                    opts.results_sheet,
+                    opts.content_config,
+                    path_prefixes[lang],
+                    variant_num,
                 )
-
-                # Generate test for the specified language
-                script_content = generator.generate_test_for_language(
-                    content_config=content_config,
-                    language=lang,
-                    output_path=output_path,
-                    variant_number=variant_num,
+            except RuntimeError as e:
+                logger.error(
+                    "❌ Failed to generate %s variant %d: %s", lang, variant_num, e
                 )
-
-                generated_files.append(output_path)
-                logger.info(
-                    "✅ Generated variant %d: %d characters",
-                    variant_num,
-                    len(script_content),
+                result = None
+            yield lang, variant_num, result
+        return
+
+    # Submit every job up front so all languages share the worker pool
+    with executor_class(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _generate_one,
+                opts.test_name,
+                lang,
+                opts.results_sheet,
+                opts.content_config,
+                path_prefixes[lang],
+                variant_num,
+            ): (lang, variant_num)
+            for lang, variant_num in jobs
+        }
+
+        for future in as_completed(futures):
+            lang, variant_num = futures[future]
+            try:
+                result = future.result()
+            except RuntimeError as e:
+                logger.error(
+                    "❌ Failed to generate %s variant %d: %s", lang, variant_num, e
                 )
+                result = None
+            yield lang, variant_num, result
 
-            except RuntimeError as e:
-                logger.error("❌ Failed to generate variant %d: %s", variant_num, e)
-                continue
+
+def iter_generate_test_variants(
+    opts: RunOpts,
+    jobs: Optional[int] = None,
+    executor_type: str = "process",
+) -> Iterator[str]:
+    """
+    Generate multiple test variants, yielding each file as it is written
+
+    Variants are independent, so they are generated in parallel, either in
+    worker processes or, for I/O-bound runs, in worker threads. Unless jobs
+    is given, process batches of at most INLINE_MAX_JOBS variants are
+    generated in the calling thread instead.
+
+    Args:
+        opts: Resolved run settings
+        jobs: Number of workers (optional, defaults to the CPU count for
+              processes and 32 for threads)
+        executor_type: "process" or "thread"
+
+    Yields:
+        Generated file paths, in completion order
+    """
+    logger.info(
+        "🎯 Generating %d variants for test '%s'", opts.variants, opts.test_name
+    )
+
+    # Create output directory if it doesn't exist; the common case of an
+    # existing directory costs a single stat
+    try:
+        if not stat.S_ISDIR(os.stat(opts.output).st_mode):
+            raise NotADirectoryError(opts.output)
+    except FileNotFoundError:
+        os.makedirs(opts.output, exist_ok=True)
+
+    # Get current date for file naming
+    current_date = time.strftime("%Y-%m-%d")
+
+    total = len(opts.languages) * opts.variants
+    if executor_type == "thread":
+        # _generate_one builds its own QuestionGenerator per call, so
+        # threads never share generator state
+        executor_class = ThreadPoolExecutor
+        default_jobs = 32
+    else:
+        executor_class = ProcessPoolExecutor
+        default_jobs = os.cpu_count() or 1
+    max_workers = max(1, min(jobs or default_jobs, total))
+    if max_workers == 1 or (
+        executor_class is ProcessPoolExecutor
+        and jobs is None
+        and total <= INLINE_MAX_JOBS
+    ):
+        executor_class = None
+        logger.info("Generating %d variants in the calling thread", total)
+    generated = 0
+    total_characters = 0
+    log_variants = logger.isEnabledFor(logging.DEBUG)
+
+    # Only the variant number changes within a language
+    path_prefixes = {
+        lang: os.path.join(
+            opts.output, f"{opts.test_name} | {current_date} | [{lang}] | Variant "
+        )
+        for lang in opts.languages
+    }
+    logger.info(
+        "📝 Generating %d variants in %s", opts.variants, ", ".join(opts.languages)
+    )
+
+    for lang, variant_num, result in _run_jobs(
+        opts, path_prefixes, executor_class, max_workers
+    ):
+        if result is None:
+            continue
+        output_path, script_length = result
+
+        generated += 1
+        total_characters += script_length
+        if log_variants:
+            logger.debug(
+                "✅ Generated %s variant %d: %d characters",
+                lang,
+                variant_num,
+                script_length,
+            )
+
+        yield output_path
 
     logger.info(
-        "🎉 Successfully generated %d/%d test variants",
-        len(generated_files),
-        len(languages_to_generate) * variants,
+        "🎉 Successfully generated %d/%d test variants (%d characters)",
+        generated,
+        total,
+        total_characters,
     )
-    return generated_files
+
+
+@lru_cache(maxsize=32)
+def _filename_pattern(test_name: Optional[str], language: Optional[str]) -> re.Pattern:
+    """
+    Compile the file name filter used by list_generated_files
+
+    File names look like "<test name> | <date> | [<lang>] | Variant <n>.gs".
+    The test name and "[lang]" tag are matched literally; as a glob,
+    "[en]" would be a character class matching "e" or "n".
+
+    Args:
+        test_name: Optional test name filter
+        language: Optional language filter ("en" or "rs")
+
+    Returns:
+        Compiled pattern for generated test file names
+    """
+    name = re.escape(test_name) if test_name else ".*"
+    lang = r" \| " + re.escape(f"[{language.lower()}]") if language else ""
+    return re.compile(rf"(?s:{name} \| .*{lang} \| .*\.gs)\Z")
 
 
 def list_generated_files(
@@ -146,29 +384,32 @@ def list_generated_files(
         language: Optional language filter ("en" or "rs")
         test_name: Optional test name filter
     """
-    if test_name:
-        pattern = f"{test_name} | * | *.gs"
-        if language:
-            pattern = f"{test_name} | * | [{language.lower()}] | *.gs"
-    else:
-        pattern = "* | * | *.gs"
-        if language:
-            pattern = f"* | * | [{language.lower()}] | *.gs"
+    match = _filename_pattern(test_name, language).match
+
+    # One directory scan; DirEntry.stat() reuses data from the scan where
+    # the platform provides it instead of a separate stat per file
+    sizes = {}
+    try:
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if match(entry.name):
+                    sizes[entry.name] = entry.stat().st_size
+    except FileNotFoundError:
+        pass
 
-    test_files = list(Path(output_dir).glob(pattern))
+    test_files = [Path(output_dir, name) for name in sizes]
 
     if test_files:
         logger.info("📁 Found %d test files in %s:", len(test_files), output_dir)
-        for file_path in sorted(test_files):
-            file_size = file_path.stat().st_size
-            logger.info("   📄 %s (%d bytes)", file_path.name, file_size)
+        for name in sorted(sizes):
+            logger.info("   📄 %s (%d bytes)", name, sizes[name])
     else:
         logger.info("📁 No test files found in %s", output_dir)
 
     return test_files
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point"""
     parser = argparse.ArgumentParser(
         description="Generate multiple test variants from JSON configuration"
@@ -197,6 +438,20 @@ def main():
         "--output-dir", "-o", help="Override output directory from config"
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of parallel workers (default: CPU count, or 32 for threads)",
+    )
+
+    parser.add_argument(
+        "--executor",
+        choices=["process", "thread"],
+        default="process",
+        help="Run variants in worker processes (CPU-bound) or threads (I/O-bound)",
+    )
+
     parser.add_argument(
         "--list-files",
         "-ls",
@@ -208,7 +463,7 @@ def main():
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set logging level
     if args.verbose:
@@ -217,47 +472,55 @@ def main():
     # Load configuration
     try:
         config = load_config(args.config)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (FileNotFoundError, ValueError) as e:
         logger.error("❌ Failed to load configuration: %s", e)
         return 1
 
-    # Determine output directory for listing files
-    output_dir = (
-        args.output_dir if args.output_dir else config.get("output-dir", "/tmp")
-    )
-
-    # List files if requested
+    # List files if requested; this only needs the output directory and
+    # test name, so configs without the generation fields can be listed
     if args.list_files:
-        list_generated_files(output_dir, args.language, test_name=config.get("name"))
+        list_generated_files(
+            args.output_dir or config.get("output-dir", "/tmp"),
+            args.language,
+            test_name=config.get("name"),
+        )
         return 0
 
+    # Resolve config values and overrides once for generation
+    try:
+        opts = resolve_run_opts(config, args.language, args.variants, args.output_dir)
+    except KeyError as e:
+        logger.error("❌ Configuration is missing required field %s", e)
+        return 1
+
     # Validate arguments
-    variants = (
-        args.variants if args.variants is not None else config.get("variants", 10)
-    )
-    if variants <= 0:
+    if opts.variants <= 0:
         logger.error("❌ Number of variants must be positive")
         return 1
 
+    if args.jobs is not None and args.jobs <= 0:
+        logger.error("❌ Number of jobs must be positive")
+        return 1
+
     try:
         # Generate tests based on config
-        all_generated_files = generate_test_variants(
-            config=config,
-            language=args.language,
-            num_variants=args.variants,
-            output_dir=args.output_dir,
+        generated_count = sum(
+            1
+            for _ in iter_generate_test_variants(
+                opts, jobs=args.jobs, executor_type=args.executor
+            )
         )
 
         # Summary
-        if all_generated_files:
+        if generated_count:
             logger.info(
                 "🎊 Generation complete! Created %d test files",
-                len(all_generated_files),
+                generated_count,
             )
-            logger.info("📂 Files saved to: %s", output_dir)
+            logger.info("📂 Files saved to: %s", opts.output)
 
             # List generated files
-            list_generated_files(output_dir, test_name=config.get("name"))
+            list_generated_files(opts.output, test_name=opts.test_name)
 
             return 0
 
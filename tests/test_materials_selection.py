@@ -0,0 +1,83 @@
+"""Tests for ranking and trimming course materials to a token budget"""
+
+import pytest
+
+pytest.importorskip("openai")
+
+from test_analyzer import (
+    CHARS_PER_TOKEN,
+    MATERIALS_SEPARATOR,
+    _bm25_scores,
+    _estimate_tokens,
+    select_relevant_materials,
+)
+
+
+def _materials(*files):
+    """Concatenate (name, content) pairs the way load_course_materials does"""
+    return MATERIALS_SEPARATOR.join(
+        f"## {name}\n\n{content}" for name, content in files
+    )
+
+
+def test_bm25_ranks_matching_document_first():
+    documents = [
+        ["cooking", "recipes", "pasta"],
+        ["neural", "networks", "learn", "weights"],
+        ["history", "of", "rome"],
+    ]
+    scores = _bm25_scores(documents, ["neural", "networks"])
+
+    assert scores.index(max(scores)) == 1
+    assert scores[0] == scores[2] == 0.0
+
+
+def test_materials_within_budget_are_unchanged():
+    materials = _materials(("a.md", "short text"), ("b.md", "more text"))
+
+    assert select_relevant_materials(materials, "question", 10_000) == materials
+
+
+def test_keeps_most_relevant_file_within_budget():
+    relevant = "machine learning model training " * 20
+    unrelated = "baking bread flour oven " * 20
+    materials = _materials(("unrelated.md", unrelated), ("relevant.md", relevant))
+    budget = _estimate_tokens(f"## relevant.md\n\n{relevant}")
+
+    result = select_relevant_materials(materials, "What is machine learning?", budget)
+
+    assert result == f"## relevant.md\n\n{relevant}"
+
+
+def test_single_oversized_file_is_truncated_not_dropped():
+    content = "transformer attention layers " * 1000
+    materials = _materials(("big.md", content))
+    budget = 100
+
+    result = select_relevant_materials(materials, "attention", budget)
+
+    assert result.startswith("## big.md\n\ntransformer attention")
+    assert _estimate_tokens(result) <= budget
+    assert len(result) >= (budget - 2) * CHARS_PER_TOKEN
+
+
+def test_oversized_relevant_file_is_preferred_over_small_unrelated_file():
+    relevant = "gradient descent optimization " * 1000
+    unrelated = "poetry and painting"
+    materials = _materials(("relevant.md", relevant), ("unrelated.md", unrelated))
+
+    result = select_relevant_materials(materials, "gradient descent", 100)
+
+    assert result.startswith("## relevant.md\n\ngradient descent")
+    assert "unrelated.md" not in result
+
+
+def test_horizontal_rules_do_not_split_files():
+    content = "introduction\n\n---\n\n" + "neural networks " * 50
+    materials = _materials(("nn.md", content), ("cooking.md", "recipes " * 50))
+
+    result = select_relevant_materials(materials, "neural networks", 20)
+
+    # The file is ranked and trimmed as a whole, keeping its header
+    assert result.startswith("## nn.md\n\nintroduction\n\n---\n\nneural networks")
+    assert "cooking.md" not in result